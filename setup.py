@@ -10,7 +10,7 @@ with open("README.md", "r", encoding="utf-8") as fh:
 
 # Read requirements
 with open("requirements.txt", "r", encoding="utf-8") as fh:
-    requirements = [line.strip() for line in fh.readlines() if line.strip() and not line.startswith("#")]
+    requirements = [req for line in fh if (req := line.strip()) and not req.startswith("#")]
 
 setup(
     name="github-analyzer-agent",
@@ -21,8 +21,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/muqatil7/github-analyzer-agent",
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
+    packages=find_packages(include=["src", "src.*"]),
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -50,7 +49,7 @@ setup(
     },
     entry_points={
         "console_scripts": [
-            "github-analyzer=main:main",
+            "github-analyzer=src.cli:main",
         ],
     },
     include_package_data=True,
@@ -1,27 +1,44 @@
 """GitHub Analyzer Agent - AI Agent for analyzing GitHub repositories."""
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "Yahya Sayed"
 __email__ = "your.email@example.com"
 __description__ = "AI Agent built with LangGraph + LangChain + LangSmith for analyzing GitHub repositories"
 
-# Import main classes for easy access
-try:
-    from .main import GitHubAnalyzerAgent
-    from .agent.github_agent import GitHubAgent
-    from .mcp.client import GitHubMCPClient
-    from .services.context_manager import ContextManager
-    from .services.langsmith_tracer import LangSmithTracer
-    from .services.openai_service import OpenAIService
-    
-    __all__ = [
-        "GitHubAnalyzerAgent",
-        "GitHubAgent", 
-        "GitHubMCPClient",
-        "ContextManager",
-        "LangSmithTracer",
-        "OpenAIService"
-    ]
-except ImportError:
-    # Handle import errors gracefully during development
-    pass
\ No newline at end of file
+__all__ = [
+    "GitHubAnalyzerAgent",
+    "GitHubAgent",
+    "GitHubMCPClient",
+    "ContextManager",
+    "LangSmithTracer",
+    "OpenAIService"
+]
+
+# Main classes are imported lazily on first access (PEP 562) so that
+# importing the package does not pull in LangChain/LangGraph/LangSmith.
+_LAZY_IMPORTS = {
+    "GitHubAnalyzerAgent": (".main", "GitHubAnalyzerAgent"),
+    "GitHubAgent": (".agent.github_agent", "GitHubAgent"),
+    "GitHubMCPClient": (".mcp.client", "GitHubMCPClient"),
+    "ContextManager": (".services.context_manager", "ContextManager"),
+    "LangSmithTracer": (".services.langsmith_tracer", "LangSmithTracer"),
+    "OpenAIService": (".services.openai_service", "OpenAIService"),
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    # Cache on the module so later lookups bypass __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
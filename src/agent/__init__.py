@@ -1,7 +1,28 @@
 """Agent module for GitHub analysis."""
 
-from .github_agent import GitHubAgent
-from .state import AgentState, AnalysisType
-from .tools import GitHubTools
+import importlib
 
-__all__ = ["GitHubAgent", "AgentState", "AnalysisType", "GitHubTools"]
\ No newline at end of file
+from .state import AgentState, AnalysisType, is_important_file, is_security_file
+
+__all__ = [
+    "GitHubAgent",
+    "AgentState",
+    "AnalysisType",
+    "GitHubTools",
+    "is_important_file",
+    "is_security_file",
+]
+
+# Heavy modules (LangChain runnables, MCP client) are loaded on first access
+_LAZY_IMPORTS = {
+    "GitHubAgent": ".github_agent",
+    "GitHubTools": ".tools",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
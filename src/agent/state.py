@@ -4,11 +4,19 @@ Agent State Management for GitHub Analysis
 إدارة حالة الوكيل لتحليل GitHub
 """
 
+import fnmatch
+import re
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, List, Any, Optional, Union
-from typing_extensions import TypedDict, NotRequired
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Deque, Dict, FrozenSet, List, Any, Mapping, Optional, Tuple, Union
+from typing_extensions import Final, TypedDict, NotRequired
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
-from pydantic import BaseModel, Field
 
 
 class AnalysisType(str, Enum):
@@ -27,42 +35,55 @@ class AnalysisStatus(str, Enum):
     FAILED = "failed"            # فشل في التنفيذ
 
 
-class RepositoryInfo(BaseModel):
+@dataclass
+class RepositoryInfo:
     """معلومات مستودع GitHub."""
-    url: str = Field(description="رابط المستودع")
-    owner: str = Field(description="مالك المستودع")
-    name: str = Field(description="اسم المستودع")
-    description: Optional[str] = Field(None, description="وصف المستودع")
-    language: Optional[str] = Field(None, description="اللغة الرئيسية")
-    languages: Dict[str, int] = Field(default_factory=dict, description="اللغات المستخدمة")
-    stars: int = Field(0, description="عدد النجوم")
-    forks: int = Field(0, description="عدد التفرعات")
-    size: int = Field(0, description="حجم المستودع")
-    default_branch: str = Field("main", description="الفرع الافتراضي")
-    files_analyzed: List[str] = Field(default_factory=list, description="قائمة الملفات المحللة")
-    security_files: List[str] = Field(default_factory=list, description="ملفات الأمان")
-    readme_content: Optional[str] = Field(None, description="محتوى README")
-
-
-class ContextInfo(BaseModel):
+    url: str                                                    # رابط المستودع
+    owner: str                                                  # مالك المستودع
+    name: str                                                   # اسم المستودع
+    description: Optional[str] = None                           # وصف المستودع
+    language: Optional[str] = None                              # اللغة الرئيسية
+    languages: Dict[str, int] = field(default_factory=dict)     # اللغات المستخدمة
+    stars: int = 0                                              # عدد النجوم
+    forks: int = 0                                              # عدد التفرعات
+    size: int = 0                                               # حجم المستودع
+    default_branch: str = "main"                                # الفرع الافتراضي
+    files_analyzed: List[str] = field(default_factory=list)     # قائمة الملفات المحللة
+    security_files: List[str] = field(default_factory=list)     # ملفات الأمان
+    readme_content: Optional[str] = None                        # محتوى README
+
+
+@dataclass
+class ContextInfo:
     """معلومات سياق المحادثة."""
-    current_tokens: int = Field(0, description="عدد الرموز الحالي")
-    max_tokens: int = Field(200000, description="الحد الأقصى للرموز")
-    summary_count: int = Field(0, description="عدد مرات التلخيص")
-    last_summary: Optional[str] = Field(None, description="آخر تلخيص")
-    preserved_messages: int = Field(5, description="عدد الرسائل المحفوظة")
+    current_tokens: int = 0                 # عدد الرموز الحالي
+    max_tokens: int = 200000                # الحد الأقصى للرموز
+    summary_count: int = 0                  # عدد مرات التلخيص
+    last_summary: Optional[str] = None      # آخر تلخيص
+    preserved_messages: int = 5             # عدد الرسائل المحفوظة
 
 
-class AnalysisResult(BaseModel):
+@dataclass
+class AnalysisResult:
     """نتائج التحليل."""
-    analysis_type: AnalysisType = Field(description="نوع التحليل")
-    status: AnalysisStatus = Field(description="حالة التحليل")
-    summary: Optional[str] = Field(None, description="ملخص النتائج")
-    findings: List[Dict[str, Any]] = Field(default_factory=list, description="النتائج التفصيلية")
-    recommendations: List[str] = Field(default_factory=list, description="التوصيات")
-    confidence_score: float = Field(0.0, description="معدل الثقة في النتائج")
-    processing_time: float = Field(0.0, description="وقت المعالجة")
-    error_message: Optional[str] = Field(None, description="رسالة خطأ إن وجدت")
+    analysis_type: AnalysisType                                     # نوع التحليل
+    status: AnalysisStatus                                          # حالة التحليل
+    summary: Optional[str] = None                                   # ملخص النتائج
+    findings: List[Dict[str, Any]] = field(default_factory=list)    # النتائج التفصيلية
+    recommendations: List[str] = field(default_factory=list)        # التوصيات
+    confidence_score: float = 0.0                                   # معدل الثقة في النتائج
+    processing_time: float = 0.0                                    # وقت المعالجة
+    error_message: Optional[str] = None                             # رسالة خطأ إن وجدت
+
+
+def trim_messages(messages: Deque[BaseMessage], keep: int) -> Deque[BaseMessage]:
+    """حذف أقدم الرسائل مع الإبقاء على آخر keep رسالة، بتكلفة O(1) لكل رسالة.
+
+    يعدّل الـ deque في مكانه ويعيده، ليُرجع من العقدة كقيمة messages الجديدة.
+    """
+    while len(messages) > keep:
+        messages.popleft()
+    return messages
 
 
 class AgentState(TypedDict):
@@ -71,7 +92,8 @@ class AgentState(TypedDict):
     تحتوي على جميع البيانات اللازمة لتتبع عملية التحليل.
     """
     # الرسائل والمحادثة
-    messages: List[BaseMessage]
+    # بدون reducer: القيمة التي تُرجعها العقدة تستبدل السجل بالكامل
+    messages: Deque[BaseMessage]
     
     # معلومات المستودع
     repository: NotRequired[RepositoryInfo]
@@ -113,15 +135,24 @@ class OutputState(TypedDict):
 
 
 # ثوابت للنظام
-CONSTANTS = {
-    "MAX_CONTEXT_TOKENS": 200000,
-    "PRESERVED_MESSAGES": 5,
-    "DEFAULT_MODEL": "gpt-4o-mini",
-    "CONTEXT_SUMMARY_TRIGGER": 0.85,  # 85% من الحد الأقصى
-    "ANALYSIS_TIMEOUT": 300,  # 5 دقائق
-    "MAX_FILE_SIZE": 100000,  # 100KB
-    "MAX_FILES_TO_ANALYZE": 50,
-}
+MAX_CONTEXT_TOKENS: Final[int] = 200_000
+PRESERVED_MESSAGES: Final[int] = 5
+DEFAULT_MODEL: Final[str] = "gpt-4o-mini"
+CONTEXT_SUMMARY_TRIGGER: Final[float] = 0.85  # 85% من الحد الأقصى
+ANALYSIS_TIMEOUT: Final[int] = 300  # 5 دقائق
+MAX_FILE_SIZE: Final[int] = 100_000  # 100KB
+MAX_FILES_TO_ANALYZE: Final[int] = 50
+
+# عرض للقراءة فقط للتوافق مع الشيفرة التي تستخدم القاموس
+CONSTANTS: Mapping[str, Any] = MappingProxyType({
+    "MAX_CONTEXT_TOKENS": MAX_CONTEXT_TOKENS,
+    "PRESERVED_MESSAGES": PRESERVED_MESSAGES,
+    "DEFAULT_MODEL": DEFAULT_MODEL,
+    "CONTEXT_SUMMARY_TRIGGER": CONTEXT_SUMMARY_TRIGGER,
+    "ANALYSIS_TIMEOUT": ANALYSIS_TIMEOUT,
+    "MAX_FILE_SIZE": MAX_FILE_SIZE,
+    "MAX_FILES_TO_ANALYZE": MAX_FILES_TO_ANALYZE,
+})
 
 # قوالب التحليل المعرفة مسبقاً
 ANALYSIS_PROMPTS = {
@@ -185,6 +216,47 @@ IMPORTANT_FILE_PATTERNS = [
 ]
 
 
+_GLOB_CHARS = frozenset("*?[")
+
+
+def _partition_patterns(patterns: List[str]) -> Tuple[FrozenSet[str], Optional["re.Pattern[str]"]]:
+    """فصل الأسماء الحرفية عن أنماط glob، ودمج الأخيرة في تعبير نمطي واحد."""
+    literals = frozenset(p for p in patterns if _GLOB_CHARS.isdisjoint(p))
+    globs = [p for p in patterns if p not in literals]
+    if not globs:
+        return literals, None
+    return literals, re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in globs))
+
+
+_SECURITY_FILE_LITERALS, _SECURITY_FILE_RE = _partition_patterns(SECURITY_FILE_PATTERNS)
+_IMPORTANT_FILE_LITERALS, _IMPORTANT_FILE_RE = _partition_patterns(IMPORTANT_FILE_PATTERNS)
+
+
+def is_security_file(name: str) -> bool:
+    """هل يطابق اسم الملف أحد أنماط ملفات الأمان."""
+    return name in _SECURITY_FILE_LITERALS or (
+        _SECURITY_FILE_RE is not None and _SECURITY_FILE_RE.match(name) is not None
+    )
+
+
+def is_important_file(name: str) -> bool:
+    """هل يطابق اسم الملف أحد أنماط الملفات المهمة للتحليل."""
+    return name in _IMPORTANT_FILE_LITERALS or (
+        _IMPORTANT_FILE_RE is not None and _IMPORTANT_FILE_RE.match(name) is not None
+    )
+
+
+@lru_cache(maxsize=1)
+def _format_timestamp(seconds: int) -> str:
+    """تنسيق الطابع الزمني بصيغة ISO (UTC) بدقة الثانية."""
+    return datetime.fromtimestamp(seconds, timezone.utc).isoformat(timespec="seconds")
+
+
+def _utc_timestamp() -> str:
+    """الطابع الزمني الحالي، يُعاد استخدام النص المنسق خلال الثانية نفسها."""
+    return _format_timestamp(int(time.time()))
+
+
 def create_initial_state(
     repo_url: str,
     analysis_type: AnalysisType,
@@ -192,20 +264,17 @@ def create_initial_state(
     session_id: Optional[str] = None
 ) -> AgentState:
     """إنشاء حالة أولية للوكيل."""
-    import uuid
-    from datetime import datetime
-    
     return AgentState(
-        messages=[
+        messages=deque([
             HumanMessage(content=f"مرحباً! أريد تحليل مستودع GitHub: {repo_url}")
-        ],
+        ]),
         analysis_type=analysis_type,
         custom_prompt=custom_prompt,
         status=AnalysisStatus.PENDING,
         current_step="initialization",
         context=ContextInfo(),
         metadata={
-            "created_at": datetime.now().isoformat(),
+            "created_at": _utc_timestamp(),
             "repo_url": repo_url,
             "version": "1.0.0"
         },
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+GitHub Analyzer Agent - Command Line Interface
+واجهة سطر الأوامر لوكيل تحليل مستودعات GitHub
+
+يعتمد هذا الملف على argparse فقط، ولا يتم تحميل LangChain/LangGraph/LangSmith
+إلا بعد نجاح تحليل المعاملات، حتى تعود أوامر --help والأخطاء بسرعة.
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import List, Optional
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """إنشاء محلل معاملات سطر الأوامر."""
+    parser = argparse.ArgumentParser(
+        prog="github-analyzer",
+        description="تحليل مستودعات GitHub باستخدام LangGraph + LangChain + LangSmith",
+    )
+    parser.add_argument("repo_url", help="رابط مستودع GitHub")
+    parser.add_argument(
+        "-t", "--type",
+        dest="analysis_type",
+        choices=("summary", "security", "custom"),
+        default="summary",
+        help="نوع التحليل (الافتراضي: summary)",
+    )
+    parser.add_argument(
+        "-p", "--prompt",
+        dest="custom_prompt",
+        default=None,
+        help="تعليمات مخصصة للتحليل (للنوع custom)",
+    )
+    return parser
+
+
+async def _run(args: argparse.Namespace) -> None:
+    """تشغيل التحليل وطباعة النتائج."""
+    # الاستيراد هنا لتجنب تكلفة تحميل المكتبات الثقيلة في مسارات المساعدة والأخطاء
+    from .main import GitHubAnalyzerAgent
+
+    analyzer = GitHubAnalyzerAgent()
+    try:
+        result = await analyzer.analyze_repository(
+            repo_url=args.repo_url,
+            analysis_type=args.analysis_type,
+            custom_prompt=args.custom_prompt,
+        )
+        print("نتائج التحليل:")
+        print(result)
+    finally:
+        await analyzer.cleanup()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """النقطة الرئيسية لأمر github-analyzer."""
+    args = _build_parser().parse_args(argv)
+
+    # تحميل .env قبل إعداد السجلات حتى يُطبق LOG_FORMAT وLOG_LEVEL منه
+    from .main import _load_dotenv_once
+    from .utils import setup_logging
+    _load_dotenv_once()
+    setup_logging()
+
+    try:
+        asyncio.run(_run(args))
+    except KeyboardInterrupt:
+        return 130
+    except Exception as e:
+        print(f"خطأ في التطبيق: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
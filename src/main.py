@@ -4,23 +4,49 @@ GitHub Analyzer Agent - Main Entry Point
 مشروع وكيل ذكي لتحليل مستودعات GitHub باستخدام LangGraph + LangChain + LangSmith
 """
 
+from __future__ import annotations
+
 import asyncio
 import logging
 import os
-from typing import Dict, Any, Optional
-
-from dotenv import load_dotenv
-from langsmith import traceable
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Tuple
 
-from .agent import GitHubAgent, AnalysisType
-from .services import ContextManager, LangSmithTracer
-from .utils import setup_logger, validate_github_url
+from .utils import get_logger, validate_github_url
 
-# تحميل المتغيرات البيئية
-load_dotenv()
+if TYPE_CHECKING:
+    from .agent import GitHubAgent, AnalysisType
+    from .services import ContextManager, LangSmithTracer
 
 # إعداد نظام السجلات
-logger = setup_logger(__name__)
+logger = get_logger(__name__)
+
+# المتغيرات البيئية المطلوبة لتشغيل الوكيل
+_REQUIRED_ENV_VARS = (
+    "OPENAI_API_KEY",
+    "LANGSMITH_API_KEY",
+    "GITHUB_PERSONAL_ACCESS_TOKEN",
+)
+
+# نتيجة فحص المتغيرات البيئية المفقودة (None قبل أول فحص)
+_missing_env_vars: Optional[Tuple[str, ...]] = None
+
+# تحويل نوع التحليل من نص إلى Enum، يُملأ عند أول استخدام حتى لا يتم
+# تحميل وحدة الحالة (LangChain) عند استيراد هذا الملف
+_ANALYSIS_TYPE_MAP: Dict[str, AnalysisType] = {}
+
+# هل تم تحميل ملف .env في هذه العملية
+_dotenv_loaded = False
+
+
+def _load_dotenv_once() -> None:
+    """تحميل المتغيرات البيئية من ملف .env مرة واحدة لكل عملية."""
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    
+    from dotenv import load_dotenv
+    load_dotenv(override=False)
+    _dotenv_loaded = True
 
 
 class GitHubAnalyzerAgent:
@@ -29,8 +55,14 @@ class GitHubAnalyzerAgent:
     يدمج LangGraph + LangChain + LangSmith + MCP لتحليل شامل.
     """
     
+    # غلاف تتبع LangSmith لـ _analyze_repository، يُنشأ عند أول استخدام
+    _traced_analyze_repository: Optional[Callable[..., Awaitable[Dict[str, Any]]]] = None
+    
     def __init__(self):
         """تهيئة الوكيل مع كل الخدمات المطلوبة."""
+        # تحميل المتغيرات البيئية عند إنشاء الوكيل وليس عند استيراد الوحدة
+        _load_dotenv_once()
+        
         self.agent: Optional[GitHubAgent] = None
         self.context_manager: Optional[ContextManager] = None
         self.tracer: Optional[LangSmithTracer] = None
@@ -43,6 +75,11 @@ class GitHubAnalyzerAgent:
         if self._initialized:
             return
             
+        # تحميل المكتبات الثقيلة عند التهيئة فقط وليس عند استيراد الوحدة
+        from .agent import GitHubAgent
+        from .agent.state import DEFAULT_MODEL, MAX_CONTEXT_TOKENS
+        from .services import ContextManager, LangSmithTracer
+
         try:
             logger.info("بدء تهيئة مكونات الوكيل...")
             
@@ -51,8 +88,8 @@ class GitHubAnalyzerAgent:
             
             # تهيئة مدير السياق
             self.context_manager = ContextManager(
-                max_tokens=200000,  # 200k tokens limit
-                model_name="gpt-4o-mini"
+                max_tokens=MAX_CONTEXT_TOKENS,  # 200k tokens limit
+                model_name=DEFAULT_MODEL
             )
             
             # تهيئة تتبع LangSmith
@@ -75,23 +112,19 @@ class GitHubAnalyzerAgent:
     
     def _validate_environment(self) -> None:
         """التحقق من وجود المتغيرات البيئية المطلوبة."""
-        required_vars = [
-            "OPENAI_API_KEY",
-            "LANGSMITH_API_KEY", 
-            "GITHUB_PERSONAL_ACCESS_TOKEN"
-        ]
-        
-        missing_vars = []
-        for var in required_vars:
-            if not os.getenv(var):
-                missing_vars.append(var)
-        
-        if missing_vars:
+        global _missing_env_vars
+        
+        # المتغيرات البيئية لا تتغير أثناء التشغيل، لذا يُفحص مرة واحدة لكل عملية
+        if _missing_env_vars is None:
+            _missing_env_vars = tuple(
+                var for var in _REQUIRED_ENV_VARS if not os.environ.get(var)
+            )
+        
+        if _missing_env_vars:
             raise ValueError(
-                f"المتغيرات البيئية المطلوبة مفقودة: {', '.join(missing_vars)}"
+                f"المتغيرات البيئية المطلوبة مفقودة: {', '.join(_missing_env_vars)}"
             )
     
-    @traceable(name="analyze_repository")
     async def analyze_repository(
         self,
         repo_url: str,
@@ -109,6 +142,23 @@ class GitHubAnalyzerAgent:
         Returns:
             نتائج التحليل
         """
+        traced = GitHubAnalyzerAgent._traced_analyze_repository
+        if traced is None:
+            # استيراد LangSmith وإنشاء الغلاف مرة واحدة عند أول تحليل فقط
+            from langsmith import traceable
+
+            traced = traceable(name="analyze_repository")(GitHubAnalyzerAgent._analyze_repository)
+            GitHubAnalyzerAgent._traced_analyze_repository = traced
+        
+        return await traced(self, repo_url, analysis_type, custom_prompt)
+
+    async def _analyze_repository(
+        self,
+        repo_url: str,
+        analysis_type: str,
+        custom_prompt: Optional[str]
+    ) -> Dict[str, Any]:
+        """تنفيذ التحليل الفعلي (ملفوف بتتبع LangSmith)."""
         if not self._initialized:
             await self.initialize()
         
@@ -139,19 +189,18 @@ class GitHubAnalyzerAgent:
     
     def _get_analysis_type(self, analysis_type: str) -> AnalysisType:
         """تحويل نوع التحليل من نص إلى Enum."""
-        type_mapping = {
-            "summary": AnalysisType.SUMMARY,
-            "security": AnalysisType.SECURITY,
-            "custom": AnalysisType.CUSTOM
-        }
+        if not _ANALYSIS_TYPE_MAP:
+            from .agent import AnalysisType
+            _ANALYSIS_TYPE_MAP.update((t.value, t) for t in AnalysisType)
         
-        if analysis_type not in type_mapping:
+        analysis_enum = _ANALYSIS_TYPE_MAP.get(analysis_type)
+        if analysis_enum is None:
             raise ValueError(
                 f"نوع تحليل غير مدعوم: {analysis_type}. "
-                f"الأنواع المدعومة: {list(type_mapping.keys())}"
+                f"الأنواع المدعومة: {list(_ANALYSIS_TYPE_MAP)}"
             )
         
-        return type_mapping[analysis_type]
+        return analysis_enum
     
     async def get_context_stats(self) -> Dict[str, Any]:
         """الحصول على إحصائيات استخدام السياق."""
@@ -1,6 +1,18 @@
 """MCP (Model Context Protocol) integration module."""
 
-from .client import GitHubMCPClient
-from .config import MCPConfig
+import importlib
 
-__all__ = ["GitHubMCPClient", "MCPConfig"]
\ No newline at end of file
+__all__ = ["GitHubMCPClient", "MCPConfig"]
+
+_LAZY_IMPORTS = {
+    "GitHubMCPClient": ".client",
+    "MCPConfig": ".config",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
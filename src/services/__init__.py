@@ -1,7 +1,19 @@
 """Services module for various utilities and integrations."""
 
-from .context_manager import ContextManager
-from .langsmith_tracer import LangSmithTracer
-from .openai_service import OpenAIService
+import importlib
 
-__all__ = ["ContextManager", "LangSmithTracer", "OpenAIService"]
\ No newline at end of file
+__all__ = ["ContextManager", "LangSmithTracer", "OpenAIService"]
+
+_LAZY_IMPORTS = {
+    "ContextManager": ".context_manager",
+    "LangSmithTracer": ".langsmith_tracer",
+    "OpenAIService": ".openai_service",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,6 +1,20 @@
 """Utilities module for common functionality."""
 
-from .logger import get_logger, setup_logging
-from .validators import GitHubURLValidator, validate_github_url
+import importlib
 
-__all__ = ["get_logger", "setup_logging", "GitHubURLValidator", "validate_github_url"]
\ No newline at end of file
+__all__ = ["get_logger", "setup_logging", "GitHubURLValidator", "validate_github_url"]
+
+_LAZY_IMPORTS = {
+    "get_logger": ".logger",
+    "setup_logging": ".logger",
+    "GitHubURLValidator": ".validators",
+    "validate_github_url": ".validators",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -3,22 +3,104 @@
 import os
 import sys
 import logging
-from typing import Optional
+import weakref
+from typing import Any, MutableMapping, Optional, Tuple
 import structlog
-from structlog.typing import FilteringBoundLogger
+
+# Keyword arguments understood by stdlib logging calls
+_STDLIB_LOG_KWARGS = frozenset(("exc_info", "stack_info", "stacklevel", "extra"))
+
+# Active log format; "fast" bypasses structlog entirely. Read from the
+# environment at import and updated by setup_logging().
+_log_format = os.getenv("LOG_FORMAT", "structured").lower()
+
+# Stdlib format used by the fast mode
+_FAST_LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+
+class _KeyValueLoggerAdapter(logging.LoggerAdapter):
+    """Stdlib logger adapter accepting structlog-style keyword context.
+
+    Context is only rendered for records that pass the level check.
+    """
+
+    def process(self, msg: Any, kwargs: MutableMapping[str, Any]) -> Tuple[Any, MutableMapping[str, Any]]:
+        context = [key for key in kwargs if key not in _STDLIB_LOG_KWARGS]
+        if context:
+            pairs = " ".join(f"{key}={kwargs.pop(key)!r}" for key in context)
+            msg = f"{msg} {pairs}"
+        return msg, kwargs
+
+
+def _configure_fast_logging(log_level: str) -> None:
+    """Attach a stdout handler to the root logger unless one is configured."""
+    logging.basicConfig(
+        format=_FAST_LOG_FORMAT,
+        stream=sys.stdout,
+        level=getattr(logging, log_level)
+    )
+
+
+class _LazyLogger:
+    """Logger proxy that binds to the backend for the active log format.
+
+    Module-level loggers are created at import time, before setup_logging()
+    may run. Backend methods are cached in the instance ``__dict__`` on first
+    use, so later calls skip the proxy entirely; setup_logging() clears the
+    cache so the next call rebinds.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        _loggers.add(self)
+
+    def _reset(self) -> None:
+        """Drop cached backend methods."""
+        name = self._name
+        self.__dict__.clear()
+        self._name = name
+
+    def __getattr__(self, attr: str) -> Any:
+        # Only reached on a cache miss
+        if _log_format == "fast":
+            backend = _KeyValueLoggerAdapter(logging.getLogger(self._name), {})
+        else:
+            backend = structlog.get_logger(self._name)
+        value = getattr(backend, attr)
+        self.__dict__[attr] = value
+        return value
+
+
+# Proxies handed out by get_logger(), rebound by setup_logging()
+_loggers: "weakref.WeakSet[_LazyLogger]" = weakref.WeakSet()
 
 
 def setup_logging(log_level: Optional[str] = None, log_format: Optional[str] = None) -> None:
     """Setup structured logging with proper configuration.
-    
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        log_format: Log format (structured, json, simple)
+        log_format: Log format (structured, json, simple, fast)
     """
+    global _log_format
+
     # Get configuration from environment or use defaults
     log_level = log_level or os.getenv("LOG_LEVEL", "INFO").upper()
     log_format = log_format or os.getenv("LOG_FORMAT", "structured").lower()
-    
+    _log_format = log_format
+
+    # Rebind existing loggers on their next call
+    for proxy in list(_loggers):
+        proxy._reset()
+
+    if log_format == "fast":
+        # Plain stdlib logging with %-style formatting, no structlog processors
+        _configure_fast_logging(log_level)
+        return
+
+    logger_factory = structlog.PrintLoggerFactory()
+    stdlib_format = "%(message)s"
+
     # Configure structlog
     if log_format == "json":
         processors = [
@@ -35,39 +117,48 @@ def setup_logging(log_level: Optional[str] = None, log_format: Optional[str] = N
             structlog.dev.ConsoleRenderer(colors=True)
         ]
     else:  # structured (default)
+        # Timestamps come from the stdlib handler; rich tracebacks only when debugging
+        exception_formatter = (
+            structlog.dev.better_traceback if log_level == "DEBUG" else structlog.dev.plain_traceback
+        )
         processors = [
             structlog.contextvars.merge_contextvars,
             structlog.processors.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.dev.ConsoleRenderer(colors=True, exception_formatter=structlog.dev.better_traceback)
+            structlog.dev.ConsoleRenderer(colors=True, exception_formatter=exception_formatter)
         ]
-    
+        logger_factory = structlog.stdlib.LoggerFactory()
+        stdlib_format = "%(asctime)s %(message)s"
+
     # Configure standard logging
     logging.basicConfig(
-        format="%(message)s",
+        format=stdlib_format,
         stream=sys.stdout,
         level=getattr(logging, log_level)
     )
-    
+
     # Configure structlog
     structlog.configure(
         processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(getattr(logging, log_level)),
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
 
-def get_logger(name: str) -> FilteringBoundLogger:
+def get_logger(name: str) -> _LazyLogger:
     """Get a structured logger instance.
-    
+
+    Calls go to a structlog logger, or with ``LOG_FORMAT=fast`` to a stdlib
+    logger adapter that accepts the same keyword context. The backend follows
+    later setup_logging() calls.
+
     Args:
         name: Logger name (typically __name__)
-        
+
     Returns:
-        Configured structlog logger
+        Logger proxy bound to the active backend
     """
-    return structlog.get_logger(name)
+    return _LazyLogger(name)
 
 
 # Default logger instance
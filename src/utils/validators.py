@@ -1,77 +1,88 @@
 """Input validation utilities for GitHub Analyzer Agent."""
 
 import re
-from typing import Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Tuple
 from urllib.parse import urlparse
-from pydantic import BaseModel, field_validator, Field
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# GitHub username/repository name pattern
+_GITHUB_NAME_RE = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?$')
 
-class GitHubURLValidator(BaseModel):
-    """Pydantic model for validating GitHub repository URLs."""
-    
-    url: str = Field(..., description="GitHub repository URL")
-    owner: Optional[str] = Field(None, description="Repository owner")
-    repo: Optional[str] = Field(None, description="Repository name")
-    
-    @field_validator('url')
-    @classmethod
-    def validate_github_url(cls, v: str) -> str:
-        """Validate that the URL is a valid GitHub repository URL."""
-        if not v:
-            raise ValueError("URL cannot be empty")
-        
-        # Parse URL
-        parsed = urlparse(v.strip())
-        
-        # Check if it's a GitHub URL
-        if parsed.netloc.lower() not in ['github.com', 'www.github.com']:
-            raise ValueError("URL must be from github.com")
-        
-        # Check if it's HTTPS
-        if parsed.scheme != 'https':
-            logger.warning("Non-HTTPS GitHub URL detected", url=v)
-        
-        # Extract and validate path
-        path_parts = [part for part in parsed.path.split('/') if part]
-        if len(path_parts) < 2:
-            raise ValueError("URL must include both owner and repository name")
-        
-        # Validate owner and repo names (GitHub username/repo constraints)
-        owner, repo = path_parts[0], path_parts[1]
-        
-        # Remove .git suffix if present
-        if repo.endswith('.git'):
-            repo = repo[:-4]
-        
-        if not _is_valid_github_name(owner):
-            raise ValueError(f"Invalid GitHub username: {owner}")
-        
-        if not _is_valid_github_name(repo):
-            raise ValueError(f"Invalid GitHub repository name: {repo}")
-        
-        return v
+# Accepted GitHub hosts
+_GITHUB_NETLOCS = frozenset(('github.com', 'www.github.com'))
+
+
+@dataclass(frozen=True)
+class GitHubURLValidator:
+    """Validated GitHub repository URL with its owner and repository name.
     
-    def model_post_init(self, __context) -> None:
-        """Extract owner and repo from validated URL."""
-        parsed = urlparse(self.url)
-        path_parts = [part for part in parsed.path.split('/') if part]
+    Raises:
+        ValueError: If URL is invalid
+    """
+    
+    url: str
+    owner: str = field(init=False)
+    repo: str = field(init=False)
+    
+    def __post_init__(self) -> None:
+        """Validate the URL and extract owner and repo."""
+        _, owner, repo = _parse_github_url(self.url)
+        object.__setattr__(self, 'owner', owner)
+        object.__setattr__(self, 'repo', repo)
+
+
+def _parse_github_url(url: str) -> Tuple[str, str, str]:
+    """Parse a GitHub repository URL and validate it in a single pass.
+    
+    Args:
+        url: GitHub repository URL
         
-        self.owner = path_parts[0]
-        self.repo = path_parts[1]
+    Returns:
+        Tuple of (url, owner, repo)
         
-        # Remove .git suffix if present
-        if self.repo.endswith('.git'):
-            self.repo = self.repo[:-4]
-            
-        logger.info(
-            "GitHub URL validated successfully",
-            url=self.url,
-            owner=self.owner,
-            repo=self.repo
-        )
+    Raises:
+        ValueError: If URL is invalid
+    """
+    if not url:
+        raise ValueError("URL cannot be empty")
+    
+    parsed = urlparse(url.strip())
+    
+    # Check if it's a GitHub URL (lowercase only when the host isn't canonical)
+    netloc = parsed.netloc
+    if netloc not in _GITHUB_NETLOCS and netloc.lower() not in _GITHUB_NETLOCS:
+        raise ValueError("URL must be from github.com")
+    
+    # Check if it's HTTPS
+    if parsed.scheme != 'https':
+        logger.warning("Non-HTTPS GitHub URL detected", url=url)
+    
+    # Extract and validate path ("/owner/repo[/rest]"); only the first two
+    # non-empty segments matter, so partition instead of splitting it all
+    owner, _, rest = parsed.path.lstrip('/').partition('/')
+    repo = rest.lstrip('/').partition('/')[0]
+    if not owner or not repo:
+        raise ValueError("URL must include both owner and repository name")
+    
+    # Validate owner and repo names (GitHub username/repo constraints)
+    repo = repo.removesuffix('.git')
+    
+    if not _is_valid_github_name(owner):
+        raise ValueError(f"Invalid GitHub username: {owner}")
+    
+    if not _is_valid_github_name(repo):
+        raise ValueError(f"Invalid GitHub repository name: {repo}")
+    
+    logger.info(
+        "GitHub URL validated successfully",
+        url=url,
+        owner=owner,
+        repo=repo
+    )
+    return url, owner, repo
 
 
 def _is_valid_github_name(name: str) -> bool:
@@ -86,10 +97,7 @@ def _is_valid_github_name(name: str) -> bool:
     if not name or len(name) > 39:
         return False
     
-    # GitHub name pattern
-    pattern = r'^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?$'
-    
-    if not re.match(pattern, name):
+    if not _GITHUB_NAME_RE.match(name):
         return False
     
     # Check for consecutive hyphens
@@ -112,8 +120,7 @@ def validate_github_url(url: str) -> Tuple[str, str, str]:
         ValueError: If URL is invalid
     """
     try:
-        validator = GitHubURLValidator(url=url)
-        return validator.url, validator.owner, validator.repo
+        return _parse_github_url(url)
     except Exception as e:
         logger.error("GitHub URL validation failed", url=url, error=str(e))
         raise ValueError(f"Invalid GitHub URL: {e}")
@@ -0,0 +1,37 @@
+"""Tests for the command line interface."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from src import cli
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestCLI:
+    """Test github-analyzer argument handling."""
+    
+    def test_help_does_not_import_main(self):
+        """Test that --help exits 0 without loading src.main."""
+        code = (
+            "import sys\n"
+            "from src import cli\n"
+            "try:\n"
+            "    cli.main(['--help'])\n"
+            "except SystemExit as e:\n"
+            "    print(e.code, 'src.main' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+        )
+        
+        assert result.stdout.splitlines()[-1] == "0 False"
+    
+    def test_invalid_analysis_type(self):
+        """Test that an unsupported --type is a usage error."""
+        with pytest.raises(SystemExit) as exc_info:
+            cli.main(["https://github.com/user/repo", "--type", "invalid"])
+        
+        assert exc_info.value.code == 2
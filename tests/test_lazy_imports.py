@@ -0,0 +1,52 @@
+"""Tests for lazy package exports."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import src
+import src.agent
+import src.mcp
+import src.services
+import src.utils
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestTopLevelPackage:
+    """Test lazy exports of the top-level package."""
+    
+    def test_import_does_not_load_heavy_dependencies(self):
+        """Test that importing src alone does not pull in LangChain, LangSmith or dotenv."""
+        code = (
+            "import sys, src; "
+            "print(','.join(m for m in ('langchain_core', 'langsmith', 'dotenv') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+        )
+        
+        assert result.stdout.strip() == ""
+    
+    def test_unknown_attribute(self):
+        """Test that unknown names raise AttributeError."""
+        with pytest.raises(AttributeError):
+            src.NotAnExport
+
+
+class TestSubpackages:
+    """Test lazy exports of the subpackages."""
+    
+    def test_export_resolved_and_cached(self):
+        """Test that a lazy export resolves and is stored in the module globals."""
+        from src.utils.validators import validate_github_url
+        
+        assert src.utils.validate_github_url is validate_github_url
+        assert vars(src.utils)["validate_github_url"] is validate_github_url
+    
+    def test_unknown_attribute(self):
+        """Test that unknown names raise AttributeError in every subpackage."""
+        for package in (src.agent, src.mcp, src.services, src.utils):
+            with pytest.raises(AttributeError):
+                package.NotAnExport
@@ -0,0 +1,50 @@
+"""Tests for logging utilities."""
+
+import logging
+
+from src.utils import logger as logger_module
+
+
+class TestFastLogging:
+    """Test the stdlib fast logging path."""
+    
+    def test_get_logger_fast(self, monkeypatch):
+        """Test that fast mode binds to a stdlib logger adapter."""
+        monkeypatch.setattr(logger_module, "_log_format", "fast")
+        
+        log = logger_module.get_logger("test.fast")
+        assert isinstance(log.info.__self__, logging.LoggerAdapter)
+        assert log.logger is logging.getLogger("test.fast")
+    
+    def test_methods_cached_on_instance(self, monkeypatch):
+        """Test that backend methods are cached so later calls skip the proxy."""
+        monkeypatch.setattr(logger_module, "_log_format", "fast")
+        log = logger_module.get_logger("test.cached")
+        
+        log.debug("first call")
+        assert "debug" in vars(log)
+        assert log.debug is vars(log)["debug"]
+    
+    def test_rebinds_after_reset(self, monkeypatch):
+        """Test that loggers created before setup follow later format changes."""
+        monkeypatch.setattr(logger_module, "_log_format", "fast")
+        log = logger_module.get_logger("test.lazy")
+        assert isinstance(log.info.__self__, logging.LoggerAdapter)
+        assert log in logger_module._loggers
+        
+        monkeypatch.setattr(logger_module, "_log_format", "structured")
+        log._reset()
+        assert not isinstance(log.info.__self__, logging.LoggerAdapter)
+    
+    def test_keyword_context(self, monkeypatch, caplog):
+        """Test that structlog-style keyword context is rendered into the message."""
+        monkeypatch.setattr(logger_module, "_log_format", "fast")
+        log = logger_module.get_logger("test.fast")
+        
+        with caplog.at_level(logging.INFO, logger="test.fast"):
+            log.info("GitHub URL validated successfully", owner="user", repo="repo")
+            log.debug("filtered", owner="user")
+        
+        assert [record.getMessage() for record in caplog.records] == [
+            "GitHub URL validated successfully owner='user' repo='repo'"
+        ]
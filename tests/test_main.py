@@ -0,0 +1,77 @@
+"""Tests for the main GitHubAnalyzerAgent entry point."""
+
+import pytest
+from src import main
+from src.main import GitHubAnalyzerAgent
+
+REQUIRED_VARS = ["OPENAI_API_KEY", "LANGSMITH_API_KEY", "GITHUB_PERSONAL_ACCESS_TOKEN"]
+
+
+@pytest.fixture(autouse=True)
+def skip_dotenv(monkeypatch):
+    """Keep a developer's .env from leaking real keys into os.environ."""
+    monkeypatch.setattr(main, "_dotenv_loaded", True)
+
+
+class TestEnvironmentValidation:
+    """Test required environment variable validation."""
+    
+    @pytest.fixture(autouse=True)
+    def reset_env_cache(self, monkeypatch):
+        """Clear the cached validation result before each test."""
+        monkeypatch.setattr(main, "_missing_env_vars", None)
+    
+    def test_missing_variables(self, monkeypatch):
+        """Test that missing variables are reported together."""
+        for var in REQUIRED_VARS:
+            monkeypatch.delenv(var, raising=False)
+        monkeypatch.setenv("OPENAI_API_KEY", "key")
+        
+        with pytest.raises(ValueError) as exc_info:
+            GitHubAnalyzerAgent()._validate_environment()
+        
+        message = str(exc_info.value)
+        assert "LANGSMITH_API_KEY" in message
+        assert "GITHUB_PERSONAL_ACCESS_TOKEN" in message
+        assert "OPENAI_API_KEY" not in message
+    
+    def test_all_variables_present(self, monkeypatch):
+        """Test that validation passes and is cached across agent instances."""
+        for var in REQUIRED_VARS:
+            monkeypatch.setenv(var, "value")
+        
+        GitHubAnalyzerAgent()._validate_environment()
+        
+        monkeypatch.delenv("OPENAI_API_KEY")
+        GitHubAnalyzerAgent()._validate_environment()
+    
+    def test_missing_variables_cached(self, monkeypatch):
+        """Test that a failed check keeps failing without re-reading the environment."""
+        for var in REQUIRED_VARS:
+            monkeypatch.delenv(var, raising=False)
+        
+        with pytest.raises(ValueError):
+            GitHubAnalyzerAgent()._validate_environment()
+        
+        for var in REQUIRED_VARS:
+            monkeypatch.setenv(var, "value")
+        
+        with pytest.raises(ValueError):
+            GitHubAnalyzerAgent()._validate_environment()
+
+
+class TestAnalysisTypeMapping:
+    """Test analysis type string to enum conversion."""
+    
+    def test_supported_types(self):
+        """Test that every supported string maps to its enum member."""
+        from src.agent.state import AnalysisType
+        
+        agent = GitHubAnalyzerAgent()
+        for analysis_type in AnalysisType:
+            assert agent._get_analysis_type(analysis_type.value) is analysis_type
+    
+    def test_unsupported_type(self):
+        """Test that unsupported types raise ValueError."""
+        with pytest.raises(ValueError):
+            GitHubAnalyzerAgent()._get_analysis_type("code_review")
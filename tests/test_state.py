@@ -0,0 +1,163 @@
+"""Tests for agent state helpers."""
+
+import fnmatch
+from collections import deque
+from datetime import datetime, timezone
+
+import pytest
+from langchain_core.messages import HumanMessage
+from src.agent.state import (
+    CONSTANTS,
+    MAX_CONTEXT_TOKENS,
+    IMPORTANT_FILE_PATTERNS,
+    SECURITY_FILE_PATTERNS,
+    AnalysisResult,
+    AnalysisStatus,
+    AnalysisType,
+    ContextInfo,
+    RepositoryInfo,
+    create_initial_state,
+    is_important_file,
+    is_security_file,
+    trim_messages,
+)
+
+
+class TestFilePatterns:
+    """Test security and important file pattern matching."""
+    
+    def test_security_files(self):
+        """Test files that should be flagged for security analysis."""
+        security_files = [
+            "requirements.txt",
+            "package.json",
+            "Cargo.toml",
+            ".env",
+            ".env.production",
+            ".dockerignore",
+            "server.key",
+            "cert.pem",
+            "auth_service.py",
+            "login.html",
+        ]
+        
+        for name in security_files:
+            assert is_security_file(name), f"Should be a security file: {name}"
+    
+    def test_non_security_files(self):
+        """Test files that should not be flagged for security analysis."""
+        other_files = ["main.py", "README.md", "requirements.txt.bak", "env.py"]
+        
+        for name in other_files:
+            assert not is_security_file(name), f"Should not be a security file: {name}"
+    
+    def test_important_files(self):
+        """Test files that should be flagged as important."""
+        important_files = ["README.md", "LICENSE", "setup.py", "main.go", "app.js"]
+        
+        for name in important_files:
+            assert is_important_file(name), f"Should be an important file: {name}"
+        
+        assert not is_important_file("utils.py")
+        assert not is_important_file("my_setup.py")
+    
+    def test_matches_fnmatch(self):
+        """Test that combined matching agrees with per-pattern fnmatch."""
+        names = [
+            "requirements.txt", ".secrets.yml", "config.json", ".config",
+            "id_rsa.key", "README.rst", "index.html", "random.txt", "Pipfile",
+        ]
+        
+        for name in names:
+            assert is_security_file(name) == any(
+                fnmatch.fnmatchcase(name, p) for p in SECURITY_FILE_PATTERNS
+            )
+            assert is_important_file(name) == any(
+                fnmatch.fnmatchcase(name, p) for p in IMPORTANT_FILE_PATTERNS
+            )
+
+
+class TestStateModels:
+    """Test state data models."""
+    
+    def test_defaults(self):
+        """Test default values of the state models."""
+        context = ContextInfo()
+        assert context.current_tokens == 0
+        assert context.max_tokens == 200000
+        assert context.preserved_messages == 5
+        
+        result = AnalysisResult(
+            analysis_type=AnalysisType.SUMMARY, status=AnalysisStatus.PENDING
+        )
+        assert result.findings == []
+        assert result.confidence_score == 0.0
+    
+    def test_mutable_defaults_not_shared(self):
+        """Test that list and dict defaults are separate per instance."""
+        first = RepositoryInfo(url="https://github.com/a/b", owner="a", name="b")
+        second = RepositoryInfo(url="https://github.com/c/d", owner="c", name="d")
+        first.files_analyzed.append("README.md")
+        first.languages["Python"] = 100
+        
+        assert second.files_analyzed == []
+        assert second.languages == {}
+
+
+class TestConstants:
+    """Test system constants."""
+    
+    def test_constants_mapping_matches_module_values(self):
+        """Test that the CONSTANTS view exposes the module-level values."""
+        assert CONSTANTS["MAX_CONTEXT_TOKENS"] == MAX_CONTEXT_TOKENS == 200000
+        assert CONSTANTS["DEFAULT_MODEL"] == "gpt-4o-mini"
+    
+    def test_constants_read_only(self):
+        """Test that the CONSTANTS view cannot be modified."""
+        with pytest.raises(TypeError):
+            CONSTANTS["MAX_CONTEXT_TOKENS"] = 1
+
+
+class TestMessages:
+    """Test message trimming helper."""
+    
+    def test_trim_messages(self):
+        """Test that only the most recent messages are kept."""
+        messages = deque(HumanMessage(content=str(i)) for i in range(10))
+        
+        trim_messages(messages, 3)
+        
+        assert [m.content for m in messages] == ["7", "8", "9"]
+        assert len(trim_messages(messages, 5)) == 3
+
+
+class TestCreateInitialState:
+    """Test initial agent state creation."""
+    
+    def test_initial_state(self):
+        """Test that the initial state is populated."""
+        url = "https://github.com/user/repo"
+        state = create_initial_state(url, AnalysisType.SECURITY)
+        
+        assert state["analysis_type"] == AnalysisType.SECURITY
+        assert state["status"] == AnalysisStatus.PENDING
+        assert state["metadata"]["repo_url"] == url
+        assert state["metadata"]["created_at"]
+        assert len(state["messages"]) == 1
+        assert state["trace_id"] != state["session_id"]
+    
+    def test_session_id_preserved(self):
+        """Test that an explicit session id is kept."""
+        state = create_initial_state(
+            "https://github.com/user/repo", AnalysisType.SUMMARY, session_id="session-1"
+        )
+        
+        assert state["session_id"] == "session-1"
+    
+    def test_created_at_is_utc(self):
+        """Test that the creation timestamp is a second-precision UTC ISO string."""
+        state = create_initial_state("https://github.com/user/repo", AnalysisType.SUMMARY)
+        created_at = datetime.fromisoformat(state["metadata"]["created_at"])
+        
+        assert created_at.tzinfo == timezone.utc
+        assert created_at.microsecond == 0
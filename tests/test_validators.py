@@ -52,6 +52,9 @@ class TestGitHubURLValidation:
             "https://github.com/user-name/repo-name",
             "https://www.github.com/123user/repo123",
             "https://github.com/user/repo/tree/main",
+            "https://GitHub.com/user/repo",
+            "https://github.com//user/repo",
+            "https://github.com/user//repo",
         ]
         
         for url in valid_urls:
@@ -76,6 +79,13 @@ class TestGitHubURLValidation:
             with pytest.raises(ValueError):
                 GitHubURLValidator(url=url)
     
+    def test_validator_is_immutable(self):
+        """Test that validated URL objects cannot be modified."""
+        validator = GitHubURLValidator(url="https://github.com/user/repo")
+        
+        with pytest.raises(AttributeError):
+            validator.owner = "other"
+    
     def test_validate_github_url_function(self):
         """Test validate_github_url convenience function."""
         url = "https://github.com/user/repo"
@@ -84,6 +94,28 @@ class TestGitHubURLValidation:
         assert validated_url == url
         assert owner == "user"
         assert repo == "repo"
+    
+    def test_validate_github_url_strips_git_suffix(self):
+        """Test that the .git suffix is removed from the repository name."""
+        url = "https://github.com/user/repo.git"
+        validated_url, owner, repo = validate_github_url(url)
+        
+        assert validated_url == url
+        assert owner == "user"
+        assert repo == "repo"
+    
+    def test_validate_github_url_skips_empty_segments(self):
+        """Test that repeated slashes in the path are ignored."""
+        for url in ["https://github.com//user/repo", "https://github.com/user//repo/"]:
+            _, owner, repo = validate_github_url(url)
+            
+            assert owner == "user"
+            assert repo == "repo"
+    
+    def test_validate_github_url_function_invalid(self):
+        """Test validate_github_url rejects invalid URLs."""
+        with pytest.raises(ValueError, match="Invalid GitHub URL"):
+            validate_github_url("https://gitlab.com/user/repo")
 
 
 class TestAnalysisTypeValidation: